@@ -0,0 +1,16 @@
+import os
+
+# Extracts are seconds of network wait, so each worker serves requests on a
+# thread pool (gthread) instead of blocking one process per request. Each
+# thread borrows a YoutubeDL from server.YDL_POOL, as do the /batch fan-out
+# threads; server.py sizes YDL_POOL_SIZE from GUNICORN_THREADS to cover both.
+wsgi_app = "server:app"
+preload_app = True
+
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+
+timeout = 120
+graceful_timeout = 30
+keepalive = 5